@@ -10,7 +10,7 @@ codesign_identity = os.environ.get("APPLE_SIGNING_IDENTITY", None)
 onedir_mode = os.environ.get("PYINSTALLER_ONEDIR", "0") == "1"
 
 a = Analysis(
-    ["src/kimi_cli/cli/__main__.py"],
+    ["src/kimi_cli/__main__.py"],
     pathex=[],
     binaries=[],
     datas=datas,
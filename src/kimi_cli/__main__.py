@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """Entry point of the `kimi` command."""
+    # Answer `--version` before importing Typer and the CLI module, which dominate the
+    # startup time of such a short-lived invocation.
+    if sys.argv[1:2] in (["--version"], ["-V"]):
+        from kimi_cli.constant import VERSION_BANNER
+
+        print(VERSION_BANNER)
+        return
+
+    from kimi_cli.cli import cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,7 @@ def acp_main() -> None:
     import acp
 
     from kimi_cli.acp.server import ACPServer
-    from kimi_cli.app import enable_logging
-    from kimi_cli.utils.logging import logger
+    from kimi_cli.utils.logging import enable_logging, logger
 
     enable_logging()
     logger.info("Starting ACP server on stdio")
@@ -17,13 +17,13 @@ from kimi_cli.cli import InputFormat, OutputFormat
 from kimi_cli.config import Config, LLMModel, LLMProvider, load_config
 from kimi_cli.llm import augment_provider_with_env_vars, create_llm, model_display_name
 from kimi_cli.session import Session
-from kimi_cli.share import get_share_dir
 from kimi_cli.soul import run_soul
 from kimi_cli.soul.agent import Runtime, load_agent
 from kimi_cli.soul.context import Context
 from kimi_cli.soul.kimisoul import KimiSoul
 from kimi_cli.utils.aioqueue import QueueShutDown
-from kimi_cli.utils.logging import logger, redirect_stderr_to_logger
+from kimi_cli.utils.logging import enable_logging as enable_logging  # re-exported
+from kimi_cli.utils.logging import logger
 from kimi_cli.utils.path import shorten_home
 from kimi_cli.wire import Wire, WireUISide
 from kimi_cli.wire.types import ContentPart, WireMessage
@@ -32,25 +32,6 @@ if TYPE_CHECKING:
     from fastmcp.mcp_config import MCPConfig
 
 
-def enable_logging(debug: bool = False, *, redirect_stderr: bool = True) -> None:
-    # NOTE: stderr redirection is implemented by swapping the process-level fd=2 (dup2).
-    # That can hide Click/Typer error output during CLI startup, so some entrypoints delay
-    # installing it until after critical initialization succeeds.
-    logger.remove()  # Remove default stderr handler
-    logger.enable("kimi_cli")
-    if debug:
-        logger.enable("kosong")
-    logger.add(
-        get_share_dir() / "logs" / "kimi.log",
-        # FIXME: configure level for different modules
-        level="TRACE" if debug else "INFO",
-        rotation="06:00",
-        retention="10 days",
-    )
-    if redirect_stderr:
-        redirect_stderr_to_logger()
-
-
 class KimiCLI:
     @staticmethod
     async def create(
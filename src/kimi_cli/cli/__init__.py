@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import sys
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
-from kimi_cli.constant import VERSION
+from kimi_cli.constant import VERSION_BANNER
 
 from .info import cli as info_cli
 from .mcp import cli as mcp_cli
 from .web import cli as web_cli
 
+if TYPE_CHECKING:
+    from kimi_cli.config import Config
+    from kimi_cli.session import Session
+
 
 class Reload(Exception):
     """Reload configuration."""
@@ -47,7 +49,7 @@ OutputFormat = Literal["text", "stream-json"]
 
 def _version_callback(value: bool) -> None:
     if value:
-        typer.echo(f"kimi, version {VERSION}")
+        typer.echo(VERSION_BANNER)
         raise typer.Exit()
 
 
@@ -309,13 +311,13 @@ def kimi(
 
     from kaos.path import KaosPath
 
-    from kimi_cli.agentspec import DEFAULT_AGENT_FILE, OKABE_AGENT_FILE
-    from kimi_cli.app import KimiCLI, enable_logging
-    from kimi_cli.config import Config, load_config_from_string
-    from kimi_cli.exception import ConfigError
-    from kimi_cli.metadata import load_metadata, save_metadata
-    from kimi_cli.session import Session
-    from kimi_cli.utils.logging import logger, open_original_stderr, redirect_stderr_to_logger
+    from kimi_cli.utils.json import JSONDecodeError, loads
+    from kimi_cli.utils.logging import (
+        enable_logging,
+        logger,
+        open_original_stderr,
+        redirect_stderr_to_logger,
+    )
 
     from .mcp import get_global_mcp_config_file
 
@@ -354,27 +356,28 @@ def kimi(
         output_format = "text"
         final_message_only = True
 
-    conflict_option_sets = [
-        {
-            "--print": print_mode,
-            "--acp": acp_mode,
-            "--wire": wire_mode,
-        },
-        {
-            "--agent": agent is not None,
-            "--agent-file": agent_file is not None,
-        },
-        {
-            "--continue": continue_,
-            "--session": session_id is not None,
-        },
-        {
-            "--config": config_string is not None,
-            "--config-file": config_file is not None,
-        },
-    ]
+    ui_modes: tuple[tuple[UIMode, bool], ...] = (
+        ("print", print_mode),
+        ("acp", acp_mode),
+        ("wire", wire_mode),
+    )
+    conflict_option_sets = (
+        tuple((f"--{mode}", active) for mode, active in ui_modes),
+        (
+            ("--agent", agent is not None),
+            ("--agent-file", agent_file is not None),
+        ),
+        (
+            ("--continue", continue_),
+            ("--session", session_id is not None),
+        ),
+        (
+            ("--config", config_string is not None),
+            ("--config-file", config_file is not None),
+        ),
+    )
     for option_set in conflict_option_sets:
-        active_options = [flag for flag, active in option_set.items() if active]
+        active_options = [flag for flag, active in option_set if active]
         if len(active_options) > 1:
             raise typer.BadParameter(
                 f"Cannot combine {', '.join(active_options)}.",
@@ -382,19 +385,17 @@ def kimi(
             )
 
     if agent is not None:
+        from kimi_cli.agentspec import DEFAULT_AGENT_FILE, OKABE_AGENT_FILE
+
         match agent:
             case "default":
                 agent_file = DEFAULT_AGENT_FILE
             case "okabe":
                 agent_file = OKABE_AGENT_FILE
 
-    ui: UIMode = "shell"
-    if print_mode:
-        ui = "print"
-    elif acp_mode:
-        ui = "acp"
-    elif wire_mode:
-        ui = "wire"
+    # At most one UI mode flag is set at this point; fall back to the shell UI.
+    active_ui_modes: list[UIMode] = [mode for mode, active in ui_modes if active]
+    ui: UIMode = active_ui_modes[0] if active_ui_modes else "shell"
 
     if prompt is not None:
         prompt = prompt.strip()
@@ -422,6 +423,10 @@ def kimi(
         config_string = config_string.strip()
         if not config_string:
             raise typer.BadParameter("Config cannot be empty", param_hint="--config")
+
+        from kimi_cli.config import load_config_from_string
+        from kimi_cli.exception import ConfigError
+
         try:
             config = load_config_from_string(config_string)
         except ConfigError as e:
@@ -435,17 +440,17 @@ def kimi(
     # Use default MCP config file if no MCP config is provided
     if not file_configs:
         default_mcp_file = get_global_mcp_config_file()
-        if default_mcp_file.exists():
+        if default_mcp_file.is_file():
             file_configs.append(default_mcp_file)
 
     try:
-        mcp_configs = [json.loads(conf.read_text(encoding="utf-8")) for conf in file_configs]
-    except json.JSONDecodeError as e:
+        mcp_configs = [loads(conf.read_bytes()) for conf in file_configs]
+    except JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="--mcp-config-file") from e
 
     try:
-        mcp_configs += [json.loads(conf) for conf in raw_mcp_config]
-    except json.JSONDecodeError as e:
+        mcp_configs += [loads(conf) for conf in raw_mcp_config]
+    except JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON: {e}", param_hint="--mcp-config") from e
 
     skills_dir: KaosPath | None = None
@@ -461,6 +466,9 @@ def kimi(
         Returns:
             The session and whether the run succeeded.
         """
+        from kimi_cli.app import KimiCLI
+        from kimi_cli.session import Session
+
         if session_id is not None:
             session = await Session.find(work_dir, session_id)
             if session is None:
@@ -529,6 +537,8 @@ def kimi(
         if not succeeded:
             return
 
+        from kimi_cli.metadata import load_metadata, save_metadata
+
         metadata = load_metadata()
 
         # Update work_dir metadata with last session
@@ -568,6 +578,8 @@ def kimi(
                 continue
             except SwitchToWeb as e:
                 if e.session_id is not None:
+                    from kimi_cli.session import Session
+
                     session = await Session.find(work_dir, e.session_id)
                     if session is not None:
                         await _post_run(session, True)
@@ -745,7 +757,7 @@ def web_worker(session_id: str) -> None:
     """Run web worker subprocess (internal)."""
     from uuid import UUID
 
-    from kimi_cli.app import enable_logging
+    from kimi_cli.utils.logging import enable_logging
     from kimi_cli.web.runner.worker import run_worker
 
     try:
@@ -759,10 +771,3 @@ def web_worker(session_id: str) -> None:
 
 cli.add_typer(mcp_cli, name="mcp")
 cli.add_typer(web_cli, name="web")
-
-
-if __name__ == "__main__":
-    if "kimi_cli.cli" not in sys.modules:
-        sys.modules["kimi_cli.cli"] = sys.modules[__name__]
-
-    sys.exit(cli())
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import sys
-
-from kimi_cli.cli import cli
+from kimi_cli.__main__ import main
 
 if __name__ == "__main__":
-    sys.exit(cli())
+    main()
@@ -1,4 +1,7 @@
-import json
+import os
+import shutil
+import tempfile
+from functools import cache
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
@@ -7,6 +10,7 @@ import typer
 cli = typer.Typer(help="Manage MCP server configurations.")
 
 
+@cache
 def get_global_mcp_config_file() -> Path:
     """Get the global MCP config file path."""
     from kimi_cli.share import get_share_dir
@@ -14,17 +18,18 @@ def get_global_mcp_config_file() -> Path:
     return get_share_dir() / "mcp.json"
 
 
-def _load_mcp_config() -> dict[str, Any]:
-    """Load MCP config from global mcp config file."""
+def _load_mcp_config(mcp_file: Path) -> dict[str, Any]:
+    """Load MCP config from the given file."""
     from fastmcp.mcp_config import MCPConfig
     from pydantic import ValidationError
 
-    mcp_file = get_global_mcp_config_file()
+    from kimi_cli.utils.json import JSONDecodeError, loads
+
     if not mcp_file.exists():
         return {"mcpServers": {}}
     try:
-        config = json.loads(mcp_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        config = loads(mcp_file.read_bytes())
+    except JSONDecodeError as e:
         raise typer.BadParameter(f"Invalid JSON in MCP config file '{mcp_file}': {e}") from e
 
     try:
@@ -35,15 +40,34 @@ def _load_mcp_config() -> dict[str, Any]:
     return config
 
 
-def _save_mcp_config(config: dict[str, Any]) -> None:
-    """Save MCP config to default file."""
-    mcp_file = get_global_mcp_config_file()
-    mcp_file.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8")
+def _save_mcp_config(config: dict[str, Any], mcp_file: Path) -> None:
+    """Save MCP config to the given file."""
+    from kimi_cli.utils.json import dumps
 
-
-def _get_mcp_server(name: str, *, require_remote: bool = False) -> dict[str, Any]:
-    """Get MCP server config by name."""
-    config = _load_mcp_config()
+    # Resolve symlinks so a linked config is updated in place rather than replaced.
+    mcp_file = mcp_file.resolve()
+    # Write to a private sibling temp file and rename it over the config, so a crash
+    # mid-write never leaves a truncated mcp.json behind and concurrent writers never
+    # share a temp file.
+    fd, tmp_name = tempfile.mkstemp(dir=mcp_file.parent, prefix=mcp_file.name, suffix=".tmp")
+    tmp_file = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(config))
+            f.flush()
+            os.fsync(f.fileno())
+        # The config may hold secrets (headers, env); keep the permissions the user set.
+        if mcp_file.exists():
+            shutil.copymode(mcp_file, tmp_file)
+        tmp_file.replace(mcp_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _get_mcp_server(name: str, mcp_file: Path, *, require_remote: bool = False) -> dict[str, Any]:
+    """Get MCP server config by name from the given file."""
+    config = _load_mcp_config(mcp_file)
     servers = config.get("mcpServers", {})
     if name not in servers:
         typer.echo(f"MCP server '{name}' not found.", err=True)
@@ -61,13 +85,13 @@ def _parse_key_value_pairs(
     """Parse key/value pairs from CLI options."""
     parsed: dict[str, str] = {}
     for item in items:
-        if separator not in item:
+        key, sep, value = item.partition(separator)
+        if not sep:
             typer.echo(
                 f"Invalid {option_name} format: {item} (expected KEY{separator}VALUE).",
                 err=True,
             )
             raise typer.Exit(code=1)
-        key, value = item.split(separator, 1)
         if strip_whitespace:
             key, value = key.strip(), value.strip()
         if not key:
@@ -141,13 +165,10 @@ def mcp_add(
     ] = None,
 ):
     """Add an MCP server."""
-    config = _load_mcp_config()
+    mcp_file = get_global_mcp_config_file()
+    config = _load_mcp_config(mcp_file)
     server_args = server_args or []
 
-    if transport not in {"stdio", "http"}:
-        typer.echo(f"Unsupported transport: {transport}.", err=True)
-        raise typer.Exit(code=1)
-
     if transport == "stdio":
         if not server_args:
             typer.echo(
@@ -189,8 +210,8 @@ def mcp_add(
     if "mcpServers" not in config:
         config["mcpServers"] = {}
     config["mcpServers"][name] = server_config
-    _save_mcp_config(config)
-    typer.echo(f"Added MCP server '{name}' to {get_global_mcp_config_file()}.")
+    _save_mcp_config(config, mcp_file)
+    typer.echo(f"Added MCP server '{name}' to {mcp_file}.")
 
 
 @cli.command("remove")
@@ -201,11 +222,12 @@ def mcp_remove(
     ],
 ):
     """Remove an MCP server."""
-    _get_mcp_server(name)
-    config = _load_mcp_config()
+    mcp_file = get_global_mcp_config_file()
+    _get_mcp_server(name, mcp_file)
+    config = _load_mcp_config(mcp_file)
     del config["mcpServers"][name]
-    _save_mcp_config(config)
-    typer.echo(f"Removed MCP server '{name}' from {get_global_mcp_config_file()}.")
+    _save_mcp_config(config, mcp_file)
+    typer.echo(f"Removed MCP server '{name}' from {mcp_file}.")
 
 
 def _has_oauth_tokens(server_url: str) -> bool:
@@ -229,7 +251,7 @@ def _has_oauth_tokens(server_url: str) -> bool:
 def mcp_list():
     """List all MCP servers."""
     config_file = get_global_mcp_config_file()
-    config = _load_mcp_config()
+    config = _load_mcp_config(config_file)
     servers: dict[str, Any] = config.get("mcpServers", {})
 
     typer.echo(f"MCP config file: {config_file}")
@@ -264,7 +286,7 @@ def mcp_auth(
     """Authorize with an OAuth-enabled MCP server."""
     import asyncio
 
-    server = _get_mcp_server(name, require_remote=True)
+    server = _get_mcp_server(name, get_global_mcp_config_file(), require_remote=True)
     if server.get("auth") != "oauth":
         typer.echo(f"MCP server '{name}' does not use OAuth. Add with --auth oauth.", err=True)
         raise typer.Exit(code=1)
@@ -296,7 +318,7 @@ def mcp_reset_auth(
     ],
 ):
     """Reset OAuth authorization for an MCP server (clear cached tokens)."""
-    server = _get_mcp_server(name, require_remote=True)
+    server = _get_mcp_server(name, get_global_mcp_config_file(), require_remote=True)
 
     try:
         from fastmcp.client.auth.oauth import FileTokenStorage
@@ -322,7 +344,7 @@ def mcp_test(
     """Test connection to an MCP server and list available tools."""
     import asyncio
 
-    server = _get_mcp_server(name)
+    server = _get_mcp_server(name, get_global_mcp_config_file())
 
     async def _test() -> None:
         import fastmcp
@@ -336,12 +358,13 @@ def mcp_test(
                 typer.echo(f"✓ Connected to '{name}'")
                 typer.echo(f"  Available tools: {len(tools)}")
                 if tools:
-                    typer.echo("  Tools:")
+                    lines = ["  Tools:"]
                     for tool in tools:
                         desc = tool.description or ""
                         if len(desc) > 50:
                             desc = desc[:47] + "..."
-                        typer.echo(f"    - {tool.name}: {desc}")
+                        lines.append(f"    - {tool.name}: {desc}")
+                    typer.echo("\n".join(lines))
         except Exception as e:
             typer.echo(f"✗ Connection failed: {type(e).__name__}: {e}", err=True)
             raise typer.Exit(code=1) from None
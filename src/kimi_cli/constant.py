@@ -5,3 +5,4 @@ import importlib.metadata
 NAME = "Kimi Code CLI"
 VERSION = importlib.metadata.version("kimi-cli")
 USER_AGENT = f"KimiCLI/{VERSION}"
+VERSION_BANNER = f"kimi, version {VERSION}"
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from hashlib import md5
 from pathlib import Path
 
@@ -10,6 +9,7 @@ from kaos.path import KaosPath
 from pydantic import BaseModel, ConfigDict, Field
 
 from kimi_cli.share import get_share_dir
+from kimi_cli.utils.json import dumps, loads
 from kimi_cli.utils.logging import logger
 
 
@@ -67,13 +67,11 @@ def load_metadata() -> Metadata:
     if not metadata_file.exists():
         logger.debug("No metadata file found, creating empty metadata")
         return Metadata()
-    with open(metadata_file, encoding="utf-8") as f:
-        data = json.load(f)
-        return Metadata(**data)
+    data = loads(metadata_file.read_bytes())
+    return Metadata(**data)
 
 
 def save_metadata(metadata: Metadata):
     metadata_file = get_metadata_file()
     logger.debug("Saving metadata to file: {file}", file=metadata_file)
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        json.dump(metadata.model_dump(), f, indent=2, ensure_ascii=False)
+    metadata_file.write_bytes(dumps(metadata.model_dump()))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import os
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_share_dir() -> Path:
-    """Get the share directory path."""
+    """Get the share directory path, creating it on first use."""
     if share_dir := os.getenv("KIMI_SHARE_DIR"):
         share_dir = Path(share_dir)
     else:
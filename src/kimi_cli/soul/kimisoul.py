@@ -238,7 +238,7 @@ class KimiSoul:
                     name=name,
                     func=self._make_skill_runner(skill),
                     description=skill.description or "",
-                    aliases=[],
+                    aliases=(),
                 )
             )
             seen_names.add(name)
@@ -262,7 +262,7 @@ class KimiSoul:
                     name=command_name,
                     func=runner.run,
                     description=skill.description or "",
-                    aliases=[],
+                    aliases=(),
                 )
             )
             seen_names.add(command_name)
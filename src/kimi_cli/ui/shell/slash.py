@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Awaitable, Callable
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from prompt_toolkit.shortcuts.choice_input import ChoiceInput
@@ -17,6 +19,8 @@ from kimi_cli.utils.datetime import format_relative_time
 from kimi_cli.utils.slashcmd import SlashCommand, SlashCommandRegistry
 
 if TYPE_CHECKING:
+    from rich.console import RenderableType
+
     from kimi_cli.ui.shell import Shell
 
 type ShellSlashCmdFunc = Callable[[Shell, str], None | Awaitable[None]]
@@ -58,28 +62,32 @@ _KEYBOARD_SHORTCUTS = [
 ]
 
 
-@registry.command(aliases=["h", "?"])
-@shell_mode_registry.command(aliases=["h", "?"])
-def help(app: Shell, args: str):
-    """Show help information"""
-    from rich.console import Group, RenderableType
+def _help_section(title: str, items: list[tuple[str, str]], color: str) -> RenderableType:
+    from rich.console import Group
     from rich.text import Text
 
     from kimi_cli.utils.rich.columns import BulletColumns
 
-    def section(title: str, items: list[tuple[str, str]], color: str) -> BulletColumns:
-        lines: list[RenderableType] = [Text.from_markup(f"[bold]{title}:[/bold]")]
-        for name, desc in items:
-            lines.append(
-                BulletColumns(
-                    Text.from_markup(f"[{color}]{name}[/{color}]: [grey50]{desc}[/grey50]"),
-                    bullet_style=color,
-                )
+    lines: list[RenderableType] = [Text.from_markup(f"[bold]{title}:[/bold]")]
+    for name, desc in items:
+        lines.append(
+            BulletColumns(
+                Text.from_markup(f"[{color}]{name}[/{color}]: [grey50]{desc}[/grey50]"),
+                bullet_style=color,
             )
-        return BulletColumns(Group(*lines))
+        )
+    return BulletColumns(Group(*lines))
 
-    renderables: list[RenderableType] = []
-    renderables.append(
+
+@cache
+def _help_preamble() -> tuple[RenderableType, ...]:
+    """The parts of `/help` that do not depend on the available commands, built once."""
+    from rich.console import Group
+    from rich.text import Text
+
+    from kimi_cli.utils.rich.columns import BulletColumns
+
+    return (
         BulletColumns(
             Group(
                 Text.from_markup("[grey50]Help! I need somebody. Help! Not just anybody.[/grey50]"),
@@ -87,17 +95,23 @@ def help(app: Shell, args: str):
                 Text.from_markup("[grey50]\u2015 The Beatles, [italic]Help![/italic][/grey50]"),
             ),
             bullet_style="grey50",
-        )
-    )
-    renderables.append(
+        ),
         BulletColumns(
             Text(
                 "Sure, Kimi is ready to help! "
                 "Just send me messages and I will help you get things done!"
             ),
-        )
+        ),
+        _help_section("Keyboard shortcuts", _KEYBOARD_SHORTCUTS, "yellow"),
     )
 
+
+@registry.command(aliases=["h", "?"])
+@shell_mode_registry.command(aliases=["h", "?"])
+def help(app: Shell, args: str):
+    """Show help information"""
+    from rich.console import Group
+
     commands: list[SlashCommand[Any]] = []
     skills: list[SlashCommand[Any]] = []
     for cmd in app.available_slash_commands.values():
@@ -106,9 +120,9 @@ def help(app: Shell, args: str):
         else:
             commands.append(cmd)
 
-    renderables.append(section("Keyboard shortcuts", _KEYBOARD_SHORTCUTS, "yellow"))
+    renderables: list[RenderableType] = list(_help_preamble())
     renderables.append(
-        section(
+        _help_section(
             "Slash commands",
             [(c.slash_name(), c.description) for c in sorted(commands, key=lambda c: c.name)],
             "blue",
@@ -116,7 +130,7 @@ def help(app: Shell, args: str):
     )
     if skills:
         renderables.append(
-            section(
+            _help_section(
                 "Skills",
                 [(c.slash_name(), c.description) for c in sorted(skills, key=lambda c: c.name)],
                 "cyan",
@@ -262,7 +276,7 @@ async def model(app: Shell, args: str):
 @shell_mode_registry.command(aliases=["release-notes"])
 def changelog(app: Shell, args: str):
     """Show release notes"""
-    from rich.console import Group, RenderableType
+    from rich.console import Group
     from rich.text import Text
 
     from kimi_cli.utils.rich.columns import BulletColumns
@@ -327,9 +341,12 @@ async def list_sessions(app: Shell, args: str):
     await current_session.refresh()
     sessions.insert(0, current_session)
 
+    # Format every row against one clock reading; the labels are plain strings, so
+    # re-rendering the picker on each keypress does no further formatting.
+    now = time.time()
     choices: list[tuple[str, str]] = []
     for session in sessions:
-        time_str = format_relative_time(session.updated_at)
+        time_str = format_relative_time(session.updated_at, now=now)
         marker = " (current)" if session.id == current_session_id else ""
         label = f"{session.title}, {time_str}{marker}"
         choices.append((session.id, label))
@@ -365,7 +382,7 @@ def web(app: Shell, args: str):
 @registry.command
 async def mcp(app: Shell, args: str):
     """Show MCP servers and tools"""
-    from rich.console import Group, RenderableType
+    from rich.console import Group
     from rich.text import Text
 
     from kimi_cli.soul.toolset import KimiToolset
@@ -1,22 +1,29 @@
+import time
 from datetime import datetime, timedelta
 
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
 
-def format_relative_time(timestamp: float) -> str:
-    """Format a timestamp as a relative time string."""
-    now = datetime.now()
-    dt = datetime.fromtimestamp(timestamp)
-    diff = now - dt
-    if diff < timedelta(minutes=5):
+
+def format_relative_time(timestamp: float, *, now: float | None = None) -> str:
+    """
+    Format a timestamp as a relative time string.
+
+    Pass `now` (a `time.time()` value) to format many timestamps against the same instant.
+    """
+    if now is None:
+        now = time.time()
+    diff = now - timestamp
+    if diff < 5 * _MINUTE:
         return "just now"
-    if diff < timedelta(hours=1):
-        minutes = int(diff.total_seconds() / 60)
-        return f"{minutes}m ago"
-    if diff < timedelta(days=1):
-        hours = int(diff.total_seconds() / 3600)
-        return f"{hours}h ago"
-    if diff < timedelta(days=7):
-        return f"{diff.days}d ago"
-    return dt.strftime("%m-%d")
+    if diff < _HOUR:
+        return f"{int(diff // _MINUTE)}m ago"
+    if diff < _DAY:
+        return f"{int(diff // _HOUR)}h ago"
+    if diff < 7 * _DAY:
+        return f"{int(diff // _DAY)}d ago"
+    return datetime.fromtimestamp(timestamp).strftime("%m-%d")
 
 
 def format_duration(seconds: int) -> str:
@@ -0,0 +1,19 @@
+"""JSON helpers for reading and writing config files as UTF-8 bytes."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+"""Raised by `loads` on invalid input."""
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from UTF-8 bytes or a string."""
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize `obj` to UTF-8 encoded, 2-space indented JSON bytes."""
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
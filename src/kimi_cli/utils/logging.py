@@ -11,6 +11,8 @@ from typing import IO
 
 from loguru import logger
 
+from kimi_cli.share import get_share_dir
+
 
 class StderrRedirector:
     def __init__(self, level: str = "ERROR") -> None:
@@ -105,6 +107,25 @@ def redirect_stderr_to_logger(level: str = "ERROR") -> None:
     _stderr_redirector.install()
 
 
+def enable_logging(debug: bool = False, *, redirect_stderr: bool = True) -> None:
+    # NOTE: stderr redirection is implemented by swapping the process-level fd=2 (dup2).
+    # That can hide Click/Typer error output during CLI startup, so some entrypoints delay
+    # installing it until after critical initialization succeeds.
+    logger.remove()  # Remove default stderr handler
+    logger.enable("kimi_cli")
+    if debug:
+        logger.enable("kosong")
+    logger.add(
+        get_share_dir() / "logs" / "kimi.log",
+        # FIXME: configure level for different modules
+        level="TRACE" if debug else "INFO",
+        rotation="06:00",
+        retention="10 days",
+    )
+    if redirect_stderr:
+        redirect_stderr_to_logger()
+
+
 def restore_stderr() -> None:
     if _stderr_redirector is not None:
         _stderr_redirector.uninstall()
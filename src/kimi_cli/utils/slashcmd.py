@@ -1,6 +1,7 @@
 import re
+import sys
 from collections.abc import Awaitable, Callable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import overload
 
 
@@ -9,13 +10,20 @@ class SlashCommand[F: Callable[..., None | Awaitable[None]]]:
     name: str
     description: str
     func: F
-    aliases: list[str]
+    aliases: tuple[str, ...]
+    _slash_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Computed once, since completers and `/help` ask for it repeatedly.
+        if self.aliases:
+            slash_name = f"/{self.name} ({', '.join(self.aliases)})"
+        else:
+            slash_name = f"/{self.name}"
+        object.__setattr__(self, "_slash_name", slash_name)
 
     def slash_name(self):
         """/name (aliases)"""
-        if self.aliases:
-            return f"/{self.name} ({', '.join(self.aliases)})"
-        return f"/{self.name}"
+        return self._slash_name
 
 
 class SlashCommandRegistry[F: Callable[..., None | Awaitable[None]]]:
@@ -60,15 +68,16 @@ class SlashCommandRegistry[F: Callable[..., None | Awaitable[None]]]:
         """
 
         def _register(f: F) -> F:
-            primary = name or f.__name__
-            alias_list = list(aliases) if aliases else []
+            # Names are interned since they are the keys of every lookup table
+            primary = sys.intern(name or f.__name__)
+            alias_tuple = tuple(sys.intern(alias) for alias in aliases) if aliases else ()
 
             # Create the primary command with aliases
             cmd = SlashCommand[F](
                 name=primary,
                 description=(f.__doc__ or "").strip(),
                 func=f,
-                aliases=alias_list,
+                aliases=alias_tuple,
             )
 
             # Register primary command
@@ -76,7 +85,7 @@ class SlashCommandRegistry[F: Callable[..., None | Awaitable[None]]]:
             self._command_aliases[primary] = cmd
 
             # Register aliases pointing to the same command
-            for alias in alias_list:
+            for alias in alias_tuple:
                 self._command_aliases[alias] = cmd
 
             return f
@@ -10,16 +10,17 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import json
 import sys
 from typing import Any
 from uuid import UUID
 
 from loguru import logger
 
-from kimi_cli.app import KimiCLI, enable_logging
+from kimi_cli.app import KimiCLI
 from kimi_cli.cli.mcp import get_global_mcp_config_file
 from kimi_cli.exception import MCPConfigError
+from kimi_cli.utils.json import JSONDecodeError, loads
+from kimi_cli.utils.logging import enable_logging
 from kimi_cli.web.store.sessions import load_session_by_id
 
 
@@ -36,11 +37,10 @@ async def run_worker(session_id: UUID) -> None:
     # Load default MCP config file if it exists
     default_mcp_file = get_global_mcp_config_file()
     mcp_configs: list[dict[str, Any]] = []
-    if default_mcp_file.exists():
-        raw = default_mcp_file.read_text(encoding="utf-8")
+    if default_mcp_file.is_file():
         try:
-            mcp_configs = [json.loads(raw)]
-        except json.JSONDecodeError:
+            mcp_configs = [loads(default_mcp_file.read_bytes())]
+        except JSONDecodeError:
             logger.warning(
                 "Invalid JSON in MCP config file: {path}",
                 path=default_mcp_file,
@@ -342,7 +342,11 @@ class WireServer:
             slash_commands.append(
                 cast(
                     JsonType,
-                    {"name": cmd.name, "description": cmd.description, "aliases": cmd.aliases},
+                    {
+                        "name": cmd.name,
+                        "description": cmd.description,
+                        "aliases": list(cmd.aliases),
+                    },
                 )
             )
 
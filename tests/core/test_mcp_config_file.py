@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from kimi_cli.cli.mcp import _save_mcp_config
+
+
+def test_save_mcp_config_writes_content(tmp_path: Path):
+    mcp_file = tmp_path / "mcp.json"
+    config = {"mcpServers": {"context7": {"url": "https://mcp.context7.com/mcp"}}}
+
+    _save_mcp_config(config, mcp_file)
+
+    assert json.loads(mcp_file.read_text(encoding="utf-8")) == config
+    assert list(tmp_path.iterdir()) == [mcp_file]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes only")
+def test_save_mcp_config_preserves_mode(tmp_path: Path):
+    mcp_file = tmp_path / "mcp.json"
+    mcp_file.write_text('{"mcpServers": {}}', encoding="utf-8")
+    mcp_file.chmod(0o600)
+
+    _save_mcp_config({"mcpServers": {"a": {"command": "npx"}}}, mcp_file)
+
+    assert mcp_file.stat().st_mode & 0o777 == 0o600
+    assert json.loads(mcp_file.read_text(encoding="utf-8")) == {
+        "mcpServers": {"a": {"command": "npx"}}
+    }
+
+
+def test_save_mcp_config_removes_temp_file_on_error(tmp_path: Path):
+    mcp_file = tmp_path / "mcp.json"
+    mcp_file.write_text('{"mcpServers": {}}', encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        _save_mcp_config({"mcpServers": {"a": object()}}, mcp_file)
+
+    assert list(tmp_path.iterdir()) == [mcp_file]
+    assert mcp_file.read_text(encoding="utf-8") == '{"mcpServers": {}}'
+
+
+def test_save_mcp_config_uses_private_temp_file(tmp_path: Path):
+    mcp_file = tmp_path / "mcp.json"
+    # A leftover temp file from another writer must be left alone.
+    stale = tmp_path / "mcp.json.tmp"
+    stale.write_text("partial", encoding="utf-8")
+
+    _save_mcp_config({"mcpServers": {}}, mcp_file)
+
+    assert json.loads(mcp_file.read_text(encoding="utf-8")) == {"mcpServers": {}}
+    assert stale.read_text(encoding="utf-8") == "partial"
+    assert sorted(tmp_path.iterdir()) == [mcp_file, stale]
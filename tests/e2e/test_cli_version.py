@@ -0,0 +1,46 @@
+"""E2E tests for `kimi --version` output."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from importlib.metadata import entry_points
+from pathlib import Path
+
+import pytest
+
+from kimi_cli.constant import VERSION
+
+# Go through the Typer app directly, bypassing the `--version` fast path in `kimi_cli.__main__`.
+_TYPER_CLI = "import sys; from kimi_cli.cli import cli; sys.argv[0] = 'kimi'; cli()"
+
+
+def _run(cmd: list[str], *, share_dir: Path) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env["KIMI_SHARE_DIR"] = str(share_dir)
+    return subprocess.run(
+        cmd,
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=30,
+    )
+
+
+def test_console_scripts_use_fast_entry_point():
+    scripts = {ep.name: ep.value for ep in entry_points(group="console_scripts")}
+    assert scripts["kimi"] == "kimi_cli.__main__:main"
+    assert scripts["kimi-cli"] == "kimi_cli.__main__:main"
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_version_fast_path_matches_typer(tmp_path: Path, flag: str):
+    typer_result = _run([sys.executable, "-c", _TYPER_CLI, flag], share_dir=tmp_path)
+    fast_result = _run([sys.executable, "-m", "kimi_cli", flag], share_dir=tmp_path)
+
+    assert typer_result.returncode == 0, typer_result.stderr
+    assert fast_result.returncode == 0, fast_result.stderr
+    assert typer_result.stdout == f"kimi, version {VERSION}\n"
+    assert fast_result.stdout == typer_result.stdout
@@ -22,7 +22,7 @@ def _make_command(
         name=name,
         description=f"{name} command",
         func=_noop,
-        aliases=list(aliases),
+        aliases=tuple(aliases),
     )
 
 
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from kimi_cli.utils.datetime import format_duration, format_relative_time
+
+NOW = 1_700_000_000.0
+
+
+def test_format_relative_time():
+    assert format_relative_time(NOW, now=NOW) == "just now"
+    assert format_relative_time(NOW + 30, now=NOW) == "just now"
+    assert format_relative_time(NOW - 299, now=NOW) == "just now"
+    assert format_relative_time(NOW - 300, now=NOW) == "5m ago"
+    assert format_relative_time(NOW - 3599, now=NOW) == "59m ago"
+    assert format_relative_time(NOW - 3600, now=NOW) == "1h ago"
+    assert format_relative_time(NOW - 86399, now=NOW) == "23h ago"
+    assert format_relative_time(NOW - 86400, now=NOW) == "1d ago"
+    assert format_relative_time(NOW - 6.5 * 86400, now=NOW) == "6d ago"
+
+    old = NOW - 30 * 86400
+    assert format_relative_time(old, now=NOW) == datetime.fromtimestamp(old).strftime("%m-%d")
+
+
+def test_format_relative_time_defaults_to_current_time():
+    assert format_relative_time(datetime.now().timestamp()) == "just now"
+
+
+def test_format_duration():
+    assert format_duration(0) == "0s"
+    assert format_duration(45) == "45s"
+    assert format_duration(3 * 3600 + 5 * 60 + 7) == "3h 5m"
+    assert format_duration(2 * 86400 + 60) == "2d 1m"
@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from kimi_cli.utils.json import JSONDecodeError, dumps, loads
+
+
+def test_roundtrip_non_ascii():
+    config = {"mcpServers": {"测试": {"command": "npx", "args": ["-y", "ünïcode"]}}}
+    data = dumps(config)
+    assert isinstance(data, bytes)
+    assert "测试".encode() in data
+    assert loads(data) == config
+    assert loads(data.decode("utf-8")) == config
+
+
+def test_dumps_matches_stdlib_layout():
+    config = {"mcpServers": {"a": {"url": "https://example.com", "headers": {"k": "v"}}}}
+    assert dumps(config).decode("utf-8") == json.dumps(config, indent=2, ensure_ascii=False)
+
+
+def test_invalid_json_raises_stdlib_compatible_error():
+    with pytest.raises(JSONDecodeError):
+        loads(b"{not json")
+    with pytest.raises(json.JSONDecodeError):
+        loads("[1,")
@@ -213,3 +213,32 @@ def test_slash_command_overwriting(test_registry: SlashCommandRegistry[Any]) ->
 }\
 """),
     )
+
+
+def test_slash_command_reregistration_keeps_order(
+    test_registry: SlashCommandRegistry[Any],
+) -> None:
+    """Re-registering a primary name replaces it in place, even if it was taken as an alias."""
+
+    @test_registry.command(name="x")  # noqa: F811
+    def _x1(app: object, args: str) -> None:  # noqa: F811 # type: ignore[reportUnusedFunction]
+        """First x."""
+        pass
+
+    @test_registry.command(name="y", aliases=["x"])  # noqa: F811
+    def _y(app: object, args: str) -> None:  # noqa: F811 # type: ignore[reportUnusedFunction]
+        """Y."""
+        pass
+
+    @test_registry.command(name="x")  # noqa: F811
+    def _x2(app: object, args: str) -> None:  # noqa: F811 # type: ignore[reportUnusedFunction]
+        """Second x."""
+        pass
+
+    commands = test_registry.list_commands()
+    assert [(cmd.name, cmd.description) for cmd in commands] == [
+        ("x", "Second x."),
+        ("y", "Y."),
+    ]
+    assert test_registry.find_command("x") is commands[0]
+    assert test_registry.find_command("y") is commands[1]